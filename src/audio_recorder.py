@@ -1,6 +1,7 @@
 """Audio recorder module for Whisper Typer UI."""
 
 import logging
+import queue
 from dataclasses import dataclass
 import numpy as np
 import sounddevice as sd
@@ -25,15 +26,70 @@ class AudioChunk:
     start_time: float
 
 
+class Float32Pool:
+    """Reuses fixed-size float32 buffers for chunk audio.
+    
+    Buffers are handed out as views of the requested length, so chunks of any
+    size up to the pool size share storage. Larger requests fall back to a
+    plain allocation and are not pooled.
+    """
+    
+    def __init__(self, size: int, cap: int = 8):
+        """Initialize buffer pool.
+        
+        Args:
+            size: Capacity of each pooled buffer in samples
+            cap: Maximum number of idle buffers kept
+        """
+        self.size = size
+        self._free: queue.LifoQueue[np.ndarray] = queue.LifoQueue(maxsize=cap)
+    
+    def get(self, n: int) -> np.ndarray:
+        """Get a float32 array of n samples (contents undefined).
+        
+        Args:
+            n: Number of samples required
+            
+        Returns:
+            Pooled view when n fits in a pooled buffer, else a fresh array
+        """
+        if n > self.size:
+            return np.empty(n, dtype=np.float32)
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            buf = np.empty(self.size, dtype=np.float32)
+        return buf[:n]
+    
+    def put(self, arr: np.ndarray) -> None:
+        """Return an array obtained from get() to the pool.
+        
+        Arrays not backed by a pooled buffer, or arriving while the pool is
+        full, are left to the garbage collector.
+        
+        Args:
+            arr: Array previously returned by get()
+        """
+        buf = arr.base if arr.base is not None else arr
+        if buf.dtype != np.float32 or buf.shape != (self.size,):
+            return
+        try:
+            self._free.put_nowait(buf)
+        except queue.Full:
+            pass
+
+
 class AudioRecorder:
     """Records audio from microphone into NumPy buffer."""
     
-    def __init__(self, sample_rate: int = 16000, channels: int = 1):
+    def __init__(self, sample_rate: int = 16000, channels: int = 1,
+                 pool: Float32Pool | None = None):
         """Initialize audio recorder.
         
         Args:
             sample_rate: Audio sample rate in Hz (default 16000 for Whisper)
             channels: Number of audio channels (default 1 = mono)
+            pool: Optional buffer pool for extracted chunk data
             
         Raises:
             MicrophoneError: If no microphone detected
@@ -42,6 +98,7 @@ class AudioRecorder:
         self.channels = channels
         self._recording: list[np.ndarray] = []
         self._stream: sd.InputStream | None = None
+        self.pool = pool
         
         # Streaming session metadata (initialized in start_recording)
         self.chunk_start_time: float = 0.0
@@ -128,6 +185,14 @@ class AudioRecorder:
         
         return audio_buffer.astype(np.float32)
     
+    def close(self) -> None:
+        """Release the audio stream if one is open; recorded audio is discarded."""
+        if self._stream:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        self._recording = []
+    
     def get_elapsed_time(self) -> float:
         """Get elapsed time since recording started.
         
@@ -149,14 +214,25 @@ class AudioRecorder:
             
         Side Effects:
             - Clears internal _recording buffer
+            - Takes chunk data from pool (if set); caller may return it with pool.put()
             - Increments current_sequence
             - Updates chunk_start_time to current elapsed time
         """
+        # Take the recorded blocks in one swap: the audio callback keeps
+        # appending to _recording, so sizing and copying must use a snapshot
+        blocks, self._recording = self._recording, []
+        
         # Concatenate all recorded chunks
-        if not self._recording:
+        if not blocks:
             audio_data = np.array([], dtype=np.float32)
+        elif self.pool is not None:
+            # Concatenate straight into a pooled buffer (flattened via reshape)
+            frames = sum(block.shape[0] for block in blocks)
+            audio_data = self.pool.get(frames * self.channels)
+            np.concatenate(blocks, axis=0,
+                           out=audio_data.reshape(frames, self.channels))
         else:
-            audio_data = np.concatenate(self._recording, axis=0)
+            audio_data = np.concatenate(blocks, axis=0)
             # Flatten to 1D if stereo
             if audio_data.ndim > 1:
                 audio_data = audio_data.flatten()
@@ -169,8 +245,7 @@ class AudioRecorder:
             start_time=self.chunk_start_time
         )
         
-        # Clear buffer and update metadata
-        self._recording = []
+        # Update metadata
         self.current_sequence += 1
         self.chunk_start_time = self.get_elapsed_time()
         
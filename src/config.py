@@ -7,16 +7,10 @@ from typing import Any
 
 import yaml
 
-
-logger = logging.getLogger(__name__)
+from utils import ConfigError
 
 
-class ConfigError(Exception):
-    """Configuration loading or validation error."""
-    
-    def __init__(self, config_key: str, message: str = ""):
-        self.config_key = config_key
-        super().__init__(f"Configuration error for '{config_key}': {message}")
+logger = logging.getLogger(__name__)
 
 
 class AppConfig:
@@ -33,6 +27,7 @@ class AppConfig:
         "vad_filter": True,
         "chunk_duration": 3,
         "cpu_workers": "auto",
+        "vad_rms_threshold": 0.005,
     }
 
     VALID_MODEL_SIZES = ["tiny", "base", "small", "medium", "large-v3"]
@@ -130,6 +125,11 @@ class AppConfig:
     def cpu_workers(self) -> str | int:
         """Number of CPU worker threads for transcription ("auto" or positive int)."""
         return self._config["cpu_workers"]
+
+    @property
+    def vad_rms_threshold(self) -> float:
+        """RMS level below which a streaming chunk is treated as silence (0 disables)."""
+        return self._config["vad_rms_threshold"]
     
     def validate(self) -> None:
         """Validate configuration values.
@@ -186,6 +186,12 @@ class AppConfig:
         if not isinstance(vad, bool):
             raise ConfigError("vad_filter", f"vad_filter must be boolean, got: {type(vad)}")
         
+        # Validate vad_rms_threshold
+        rms = self.vad_rms_threshold
+        if isinstance(rms, bool) or not isinstance(rms, (int, float)) or rms < 0:
+            raise ConfigError("vad_rms_threshold",
+                f"vad_rms_threshold must be a non-negative number, got: {rms}")
+        
         # Validate chunk_duration
         chunk_dur = self.chunk_duration
         if not isinstance(chunk_dur, int) or chunk_dur <= 0:
@@ -2,167 +2,246 @@
 
 import logging
 from concurrent.futures import ThreadPoolExecutor, Future
-from queue import Queue
-from typing import Callable, Optional
+from typing import Any, Callable, Sequence
 import threading
 
+import numpy as np
+
 from audio_recorder import AudioChunk
-from utils import ChunkTranscriptionResult
 
 
 logger = logging.getLogger(__name__)
 
 
 class StreamingSession:
-    """Manages parallel transcription of audio chunks with ordered text insertion.
+    """Manages incremental transcription of a rolling audio buffer.
+    
+    Implements the LocalAgreement-2 policy: every round re-transcribes the
+    whole unconfirmed buffer and only the longest word prefix on which two
+    consecutive rounds agree is inserted. The buffer is then trimmed at the end
+    of the last confirmed word, so per-round work stays bounded by the
+    unconfirmed tail rather than growing with the session.
     
-    Uses a ThreadPoolExecutor with 3 workers to transcribe chunks in parallel while
-    maintaining correct text order through sequence numbers.
+    Each round depends on the previous round's hypothesis, so rounds run one at
+    a time on a single worker thread. Chunks arriving while a round is still
+    queued join that round instead of queueing one of their own, so a slow
+    round is followed by one catch-up round rather than a backlog.
     """
     
+    # Default cap on buffered audio: past it the hypothesis is force-committed
+    # and the buffer cut, otherwise every round re-transcribes the whole stall
+    MAX_BUFFER_SECONDS = 20.0
+    
+    # Characters of confirmed text passed to the model as prompt
+    PROMPT_CHARS = 200
+    
     def __init__(
         self,
-        transcribe_fn: Callable[[AudioChunk], ChunkTranscriptionResult],
+        transcribe_fn: Callable[[np.ndarray, str], Sequence[Any]],
         insert_text_fn: Callable[[str], None],
-        on_error: Callable[[Exception], None]
+        on_error: Callable[[Exception], None],
+        sample_rate: int = 16000,
+        worker_initializer: Callable[[], None] | None = None,
+        max_buffer_seconds: float = MAX_BUFFER_SECONDS
     ):
         """Initialize streaming session.
         
         Args:
-            transcribe_fn: Function to transcribe a single chunk (from Transcriber)
+            transcribe_fn: Function returning timestamped words for an audio
+                buffer and a prompt (from Transcriber.transcribe_words)
             insert_text_fn: Function to insert text at cursor (from TextInserter)
-            on_error: Callback for any chunk transcription error
+            on_error: Callback for any transcription error
+            sample_rate: Sample rate of submitted chunks in Hz
+            worker_initializer: Optional callable run once on the worker thread
+                before its first round (e.g. to set CPU affinity)
+            max_buffer_seconds: Buffer length that forces a commit; must
+                leave room for at least two chunks
         """
         self._transcribe_fn = transcribe_fn
         self._insert_text_fn = insert_text_fn
         self._on_error = on_error
+        self._sample_rate = sample_rate
+        self._max_buffer_samples = int(max_buffer_seconds * sample_rate)
         
-        # Thread pool for parallel transcription
-        self._executor = ThreadPoolExecutor(max_workers=3)
+        # Single worker: rounds must observe each other's results in order
+        self._executor = ThreadPoolExecutor(max_workers=1, initializer=worker_initializer)
         
-        # Ordered insertion buffer: {sequence: ChunkTranscriptionResult}
-        self._completed_chunks: dict[int, ChunkTranscriptionResult] = {}
+        # Audio not yet covered by confirmed words (worker thread only)
+        self._buffer = np.zeros(0, dtype=np.float32)
         
-        # Next expected sequence number for insertion
-        self._next_insert_sequence: int = 0
+        # Unconfirmed words from the previous round
+        self._hypothesis: list[Any] = []
+        
+        # Text inserted so far, used as prompt for the next round
+        self._committed_text: str = ""
+        
+        # Chunks not yet taken by a round, and the queued round that will take them
+        self._pending_chunks: list[AudioChunk] = []
+        self._queued_round: Future | None = None
+        self._pending_lock = threading.Lock()
         
         # Track active futures for cleanup
         self._active_futures: list[Future] = []
         
         # Error flag to cancel remaining work
         self._has_error: bool = False
-        
-        # Lock for thread-safe access to _completed_chunks and _next_insert_sequence
-        self._lock = threading.Lock()
     
-    def submit_chunk(self, chunk: AudioChunk) -> None:
-        """Submit an audio chunk for parallel transcription.
+    def submit_chunk(self, chunk: AudioChunk) -> Future | None:
+        """Append an audio chunk to the rolling buffer and run a round.
         
         Args:
             chunk: AudioChunk with data, sequence, and start_time
-            
+        
+        Returns:
+            Future of the round, or None if the session has failed. Once it
+            is done, chunk.data is no longer referenced.
+        
         Side Effects:
-            Spawns worker thread to transcribe chunk
+            Queues a transcription round on the worker thread, or joins
+            the round already queued
         """
         if self._has_error:
-            return  # Don't submit new work if session has error
+            return None  # Don't submit new work if session has error
         
-        logger.info(f"[CHUNK {chunk.sequence}] Submitted to transcription queue (worker pool)")
-        future = self._executor.submit(self._worker_thread, chunk)
-        future.add_done_callback(self._on_chunk_complete)
+        with self._pending_lock:
+            self._pending_chunks.append(chunk)
+            if self._queued_round is not None:
+                logger.info("[CHUNK %d] Joined queued round", chunk.sequence)
+                return self._queued_round
+            future = self._executor.submit(self._process_round)
+            self._queued_round = future
+        
+        logger.info("[CHUNK %d] Submitted to transcription queue", chunk.sequence)
+        future.add_done_callback(self._on_round_complete)
         self._active_futures.append(future)
+        return future
+    
+    @property
+    def has_pending_words(self) -> bool:
+        """Whether words await agreement, or a round that may leave some is unfinished."""
+        # Rounds run in submission order, so only the latest one needs checking
+        return bool(self._hypothesis) or any(not f.done() for f in self._active_futures[-1:])
     
-    def _worker_thread(self, chunk: AudioChunk) -> ChunkTranscriptionResult:
-        """Worker function to transcribe a single chunk.
+    @staticmethod
+    def _normalize(word: Any) -> str:
+        """Comparison key for a word across rounds."""
+        return word.word.strip().lower()
+    
+    def _process_round(self) -> None:
+        """Run one agreement round over the buffer plus all pending chunks."""
+        with self._pending_lock:
+            chunks, self._pending_chunks = self._pending_chunks, []
+            self._queued_round = None  # Later chunks need a new round
+        
+        if self._has_error or not chunks:
+            return
+        
+        sequence = chunks[-1].sequence
+        self._buffer = np.concatenate([self._buffer, *(c.data for c in chunks)])
+        logger.info("[CHUNK %d] Transcribing %.1fs buffer...",
+                    sequence, len(self._buffer) / self._sample_rate)
+        words = list(self._transcribe_fn(
+            self._buffer, self._committed_text[-self.PROMPT_CHARS:]
+        ))
+        
+        # Longest common prefix with the previous round's hypothesis
+        agreed = 0
+        for prev, curr in zip(self._hypothesis, words):
+            if self._normalize(prev) != self._normalize(curr):
+                break
+            agreed += 1
+        
+        forced = len(self._buffer) > self._max_buffer_samples
+        if forced:
+            logger.warning("[CHUNK %d] No agreement within %.0fs - committing hypothesis",
+                           sequence, self._max_buffer_samples / self._sample_rate)
+            if not words:
+                # Nothing recognized this round (noise above the RMS gate, or
+                # VAD removed it all); the previous hypothesis still refers to
+                # the unchanged buffer start, so commit it rather than lose it
+                words = self._hypothesis
+            agreed = len(words)
+        
+        confirmed, self._hypothesis = words[:agreed], words[agreed:]
+        if confirmed:
+            self._commit(confirmed)
+        elif not forced:
+            return
+        
+        # Drop audio up to the end of the last confirmed word; the hypothesis
+        # is only compared by text, so its timestamps need no shifting. A
+        # forced commit keeps at most this round's new audio, even when the
+        # recognized words sit early in the buffer.
+        cut = int(confirmed[-1].end * self._sample_rate) if confirmed else 0
+        if forced:
+            cut = max(cut, len(self._buffer) - sum(len(c.data) for c in chunks))
+        self._buffer = self._buffer[min(cut, len(self._buffer)):]
+        logger.info("[CHUNK %d] Confirmed %d words, %d pending",
+                    sequence, len(confirmed), len(self._hypothesis))
+    
+    def _commit(self, words: Sequence[Any]) -> None:
+        """Insert confirmed words at the cursor.
         
         Args:
-            chunk: AudioChunk to transcribe
-            
-        Returns:
-            ChunkTranscriptionResult with sequence, text, and optional error
+            words: Words in order; each carries its own leading space
         """
-        logger.info(f"[CHUNK {chunk.sequence}] Worker started transcription...")
-        try:
-            result = self._transcribe_fn(chunk)
-            logger.info(f"[CHUNK {chunk.sequence}] Worker finished transcription: {len(result.text)} chars")
-            return result
-        except Exception as e:
-            # Return error result instead of raising
-            logger.error(f"[CHUNK {chunk.sequence}] Worker error: {e}")
-            return ChunkTranscriptionResult(
-                sequence=chunk.sequence,
-                text="",
-                error=str(e)
-            )
+        text = "".join(w.word for w in words)
+        if not self._committed_text:
+            text = text.lstrip()
+        if text:
+            self._committed_text += text
+            self._insert_text_fn(text)
     
-    def _on_chunk_complete(self, future: Future) -> None:
-        """Callback when a chunk transcription completes.
+    def _on_round_complete(self, future: Future) -> None:
+        """Callback when a transcription round completes.
         
         Args:
-            future: Completed Future containing ChunkTranscriptionResult
-            
+            future: Completed Future of _process_round
+        
         Side Effects:
-            - Stores result in _completed_chunks
-            - Inserts text if sequence is next expected
-            - Calls _on_error if chunk has error
+            Calls _on_error if the round failed
         """
-        try:
-            result = future.result()
-            
-            # Check for chunk-level error
-            if result.error:
-                self._has_error = True
-                self._on_error(Exception(f"Chunk {result.sequence} error: {result.error}"))
-                return
-            
-            logger.info(f"[CHUNK {result.sequence}] Transcription complete: {len(result.text)} characters")
-            
-            # Store completed chunk and insert text in thread-safe manner
-            with self._lock:
-                self._completed_chunks[result.sequence] = result
-                
-                # Insert all consecutive completed chunks
-                while self._next_insert_sequence in self._completed_chunks:
-                    chunk_result = self._completed_chunks.pop(self._next_insert_sequence)
-                    if chunk_result.text and not chunk_result.error:  # Only insert non-empty text
-                        logger.info(f"[CHUNK {chunk_result.sequence}] Inserting text now")
-                        self._insert_text_fn(chunk_result.text)
-                    self._next_insert_sequence += 1
-                
-        except Exception as e:
+        error = future.exception()
+        if error is not None and not self._has_error:
+            logger.error("Streaming round error: %s", error)
             self._has_error = True
-            self._on_error(e)
+            self._on_error(error)
+    
+    def append_and_finalize(self, final_chunk: AudioChunk) -> None:
+        """Submit the trailing audio and finalize the session.
+        
+        The tail joins the rolling buffer, merging into the last round if that
+        is still queued, so it costs at most one more transcription; all of
+        that round's words are then inserted by finalize_and_insert.
+        
+        Args:
+            final_chunk: Audio recorded since the last extracted chunk
+        """
+        if len(final_chunk.data) > 0:
+            self.submit_chunk(final_chunk)
+        self.finalize_and_insert()
     
     def finalize_and_insert(self) -> None:
-        """Wait for all pending chunks and insert remaining text.
+        """Wait for all pending rounds and insert remaining text.
         
-        Blocks until all submitted chunks complete transcription.
-        Inserts any remaining buffered text in correct order.
+        Blocks until all submitted rounds complete, then inserts the last
+        round's unconfirmed words: no further audio will arrive to confirm
+        or revise them.
         
         Side Effects:
             - Shuts down executor
-            - Inserts all buffered text
+            - Inserts the remaining hypothesis
         """
-        logger.info("[FINALIZE] Waiting for all worker threads to complete...")
-        # Shutdown executor and wait for all workers
+        logger.info("[FINALIZE] Waiting for pending rounds to complete...")
         self._executor.shutdown(wait=True)
-        logger.info("[FINALIZE] All workers completed")
-        
-        # Insert any remaining buffered chunks in order (thread-safe)
-        # Note: Chunks already inserted in _on_chunk_complete were pop()'d from buffer
-        with self._lock:
-            sequences = sorted(self._completed_chunks.keys())
-            if sequences:
-                logger.info(f"[FINALIZE] Found {len(sequences)} chunks still in buffer - inserting now")
-                
-                for seq in sequences:
-                    result = self._completed_chunks[seq]
-                    if result.text and not result.error:
-                        logger.info(f"[CHUNK {seq}] Inserting remaining text ({len(result.text)} chars)")
-                        self._insert_text_fn(result.text)
-            else:
-                logger.info("[FINALIZE] No chunks in buffer - all were inserted during recording")
-            
-            # Clear the buffer
-            self._completed_chunks.clear()
-            logger.info("[FINALIZE] Buffer cleared")
+        logger.info("[FINALIZE] All rounds completed")
+        
+        if self._hypothesis and not self._has_error:
+            logger.info("[FINALIZE] Inserting %d unconfirmed words", len(self._hypothesis))
+            self._commit(self._hypothesis)
+        else:
+            logger.info("[FINALIZE] No pending words - all were inserted during recording")
+        
+        self._hypothesis = []
+        self._buffer = np.zeros(0, dtype=np.float32)
+        logger.info("[FINALIZE] Buffer cleared")
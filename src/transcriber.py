@@ -8,9 +8,9 @@ from typing import Any
 
 import numpy as np
 from faster_whisper import WhisperModel
+from faster_whisper.transcribe import Word
 
-from audio_recorder import AudioChunk
-from utils import TranscriptionResult, TranscriptionError, ModelLoadError, ChunkTranscriptionResult
+from utils import TranscriptionResult, TranscriptionError, ModelLoadError
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,7 @@ class Transcriber:
         beam_size: int = 5,
         vad_filter: bool = True,
         cpu_workers: str | int = "auto",
+        cpu_threads: int = 0,
     ):
         """Initialize transcriber and load model.
         
@@ -38,6 +39,7 @@ class Transcriber:
             language: ISO 639-1 primary language code
             beam_size: Beam size for transcription (lower = faster)
             vad_filter: Whether to use VAD filter to skip silence
+            cpu_threads: CTranslate2 intra-op threads (0 = library default)
             
         Raises:
             ModelLoadError: If model download/loading fails
@@ -50,6 +52,23 @@ class Transcriber:
         self.vad_filter = vad_filter
         self.num_workers = self._resolve_workers(cpu_workers)
 
+        # Decoding options don't change between calls, so build them once
+        common_options: dict[str, Any] = {
+            "language": self.language,
+            "beam_size": self.beam_size,
+            "vad_filter": self.vad_filter,
+        }
+        if self.num_workers:
+            common_options["num_workers"] = self.num_workers
+        self._transcribe_options = {**common_options, "without_timestamps": True}
+        self._word_options = {
+            **common_options,
+            "word_timestamps": True,
+            # The prompt carries context across rounds; the model's own
+            # previous-window conditioning would only repeat it
+            "condition_on_previous_text": False,
+        }
+
         # Load model
         try:
             logger.info(
@@ -62,7 +81,8 @@ class Transcriber:
             self.model = WhisperModel(
                 model_size,
                 device=self.device,
-                compute_type=self.compute_type
+                compute_type=self.compute_type,
+                cpu_threads=cpu_threads,
             )
             logger.info("Model loaded successfully")
         except Exception as e:
@@ -98,6 +118,16 @@ class Transcriber:
             return compute_type
 
         if device == "cuda":
+            # Streaming rounds are memory-bound on the encoder; int8 weights
+            # halve that traffic while activations stay float16. GPUs without
+            # int8 kernels don't support it, so check before picking it.
+            try:
+                import ctranslate2  # Installed with faster-whisper
+
+                if "int8_float16" in ctranslate2.get_supported_compute_types("cuda"):
+                    return "int8_float16"
+            except Exception:
+                logger.debug("CUDA compute type detection failed; using float16", exc_info=True)
             return "float16"
 
         return "int8"
@@ -140,18 +170,9 @@ class Transcriber:
             
             # Transcribe with language hint
             # Note: This is the CPU-intensive blocking operation
-            transcribe_options: dict[str, Any] = {
-                "language": self.language,
-                "beam_size": self.beam_size,
-                "vad_filter": self.vad_filter,
-                "without_timestamps": True,
-            }
-            if self.num_workers:
-                transcribe_options["num_workers"] = self.num_workers
-
             segments, info = self.model.transcribe(
                 audio_buffer,
-                **transcribe_options,
+                **self._transcribe_options,
             )
             
             logger.info("Transcription model finished, collecting segments...")
@@ -182,46 +203,26 @@ class Transcriber:
         except Exception as e:
             raise TranscriptionError(e, audio_length)
     
-    def transcribe_chunk(self, chunk: AudioChunk) -> ChunkTranscriptionResult:
-        """Transcribe a single audio chunk for streaming mode.
+    def transcribe_words(self, audio: np.ndarray, initial_prompt: str = "") -> list[Word]:
+        """Transcribe audio with word-level timestamps for streaming agreement.
         
         Args:
-            chunk: AudioChunk with data, sequence, and start_time
+            audio: Audio samples, shape (n_samples,), dtype float32
+            initial_prompt: Already-confirmed text to condition the decoder on
             
         Returns:
-            ChunkTranscriptionResult with sequence, text, and optional error
+            Words in order, with start/end in seconds relative to the start of audio
+            
+        Raises:
+            TranscriptionError: If transcription fails
         """
         try:
-            # Transcribe chunk audio
-            transcribe_options: dict[str, Any] = {
-                "language": self.language,
-                "beam_size": self.beam_size,
-                "vad_filter": self.vad_filter,
-                "without_timestamps": True,
-            }
-            if self.num_workers:
-                transcribe_options["num_workers"] = self.num_workers
+            transcribe_options = self._word_options
+            if initial_prompt:
+                transcribe_options = {**transcribe_options, "initial_prompt": initial_prompt}
 
-            segments, info = self.model.transcribe(
-                chunk.data,
-                **transcribe_options,
-            )
-            
-            # Collect transcribed text
-            segments = list(segments)
-            text = " ".join([seg.text for seg in segments]).strip()
-            
-            return ChunkTranscriptionResult(
-                sequence=chunk.sequence,
-                text=text,
-                error=None
-            )
+            segments, info = self.model.transcribe(audio, **transcribe_options)
+            return [word for segment in segments for word in (segment.words or ())]
             
         except Exception as e:
-            # Return error result instead of raising
-            return ChunkTranscriptionResult(
-                sequence=chunk.sequence,
-                text="",
-                error=str(e)
-            )
-
+            raise TranscriptionError(e, len(audio) / 16000.0)
@@ -1,7 +1,13 @@
 """UI overlay module for Whisper Typer UI."""
 
 import logging
+import math
+import queue
+import threading
+import time
+import traceback
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
 from PIL import Image, ImageTk
@@ -15,6 +21,17 @@ logger = logging.getLogger(__name__)
 class UIOverlay:
     """Circular overlay UI window."""
     
+    ROTATION_STEP = 10  # Degrees per rotation frame
+    ROTATION_INTERVAL = 0.030  # Seconds per rotation frame (~33 FPS)
+    MAX_REDRAW_RATE = 20.0  # Default pulsation redraw cap in Hz
+    PULSE_SPEED = 2.4  # Sine phase advance in radians per second
+    DRAIN_INTERVAL_MS = 16  # Command queue drain period while shown or animating (~60 Hz)
+    IDLE_DRAIN_INTERVAL_MS = 200  # Command queue drain period while hidden and idle
+    
+    # Decoded icons shared across instances: {(icon_type, size): (image, rotation_frames)}.
+    # Only PIL data is shared; a PhotoImage belongs to one Tcl interpreter.
+    _icon_cache: dict[tuple[IconType, int], tuple[Image.Image, list[Image.Image]]] = {}
+    
     def __init__(self, size: int = 240, margin: int = 20):
         """Initialize UI overlay window.
         
@@ -42,7 +59,9 @@ class UIOverlay:
             # Linux/Mac - use alpha for semi-transparency
             self.window.attributes('-alpha', 0.95)
         
-        # Position in bottom-right corner
+        # Position in bottom-right corner (screen size cached, refreshed on each show)
+        self._screen_size = self._query_screen_size()
+        self._geometry = self._compute_geometry()
         self._position_window()
         
         # Create canvas for drawing
@@ -55,48 +74,62 @@ class UIOverlay:
         )
         self.canvas.pack()
         
-        # Draw circle background (filled)
+        # Draw circle (filled background + border in a single canvas item;
+        # pulsation only recolors/resizes its outline, never toggles item state)
         padding = 30
-        self.bg_circle_id = self.canvas.create_oval(
-            padding, padding,
-            size - padding, size - padding,
-            fill='#2d2d2d',  # Slightly lighter gray for circle background
-            outline=''
-        )
-        
-        # Draw main circle outline (constant)
         self.circle_id = self.canvas.create_oval(
             padding, padding,
             size - padding, size - padding,
+            fill='#2d2d2d',  # Slightly lighter gray for circle background
             outline='#ff4444',  # Brighter red
             width=6
         )
         
-        # Draw glow circle outline (for pulsation effect)
-        self.glow_circle_id = self.canvas.create_oval(
-            padding - 3, padding - 3,
-            size - padding + 3, size - padding + 3,
-            outline='#ff4444',  # Same color as main circle
-            width=3
-        )
-        # Hide glow initially
-        self.canvas.itemconfig(self.glow_circle_id, state='hidden')
-        
-        # Icon placeholder
-        self.icon_id = None
+        # Icon item (created once; icon changes only swap its image)
+        self.icon_id = self.canvas.create_image(size // 2, size // 2)
         self.current_icon: IconType | None = None
         self._photo_image = None  # Keep reference to prevent garbage collection
         self._original_image = None  # Keep original PIL image for rotation
+        self._rotation_frames: list[Image.Image] = []  # Pre-rotated icon frames
+        self._rotation_photo = None  # Single PhotoImage reused for all rotation frames
+        self._rotation_photo_shown = False  # Whether icon item currently displays _rotation_photo
+        self._installed_icon: IconType | None = None  # Icon currently drawn on canvas
+        self._icon_loading: set[IconType] = set()  # Icons with a decode in flight
+        self._icon_photos: dict[IconType, ImageTk.PhotoImage] = {}  # This window's icon images
+        # Single worker keeps PIL decode/resize off the tkinter main thread
+        self._icon_executor = ThreadPoolExecutor(max_workers=1)
         
         # Pulsation state
         self.pulsating = False
         self._pulsation_job = None
-        self._current_border_color = '#ff4444'  # Store current border color for glow
+        # Animation steps are registered as Tcl commands once and re-armed by
+        # name, instead of tkinter creating a new command wrapper per tick
+        self._pulse_cmd = self.window.register(self._pulsate)
+        self._current_border_color = '#ff4444'  # Base color the pulsation modulates
+        self._border_rgb = self._parse_color(self._current_border_color)  # Parsed once per color change
+        # Last colors applied to the canvas, used to skip redundant itemconfig calls
+        self._last_main_color: str | None = '#ff4444'
+        self._last_main_width = 6
+        self._pulsation_time = 0.0
+        self._pulse_epoch = 0
+        self._pulsate_start = 0.0
+        self._pulsate_next = 0.0
+        self._last_pulse_draw = 0.0
+        self.max_redraw_rate = self.MAX_REDRAW_RATE  # Hz; lower to throttle pulsation redraws
         
         # Rotation state (for processing animation)
         self.rotating = False
         self._rotation_job = None
+        self._rotate_cmd = self.window.register(self._rotate)
         self._rotation_angle = 0
+        self._rotation_next = 0.0
+        self._rotation_epoch = 0
+        
+        # Cross-thread updates: pending state changes (last value per key wins) and
+        # one-off callables, both applied by a single periodic drain in the main thread
+        self._pending_state: dict[str, object] = {}
+        self._pending_lock = threading.Lock()
+        self._cmd_q: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
         
         # Click callback
         self.click_callback: Callable[[], None] | None = None
@@ -104,38 +137,143 @@ class UIOverlay:
         
         # Start hidden
         self.window.withdraw()
+        self._visible = False
+        
+        # Start draining queued updates (registered once, like the animation steps)
+        self._drain_cmd = self.window.register(self._drain)
+        self.window.tk.call('after', self.DRAIN_INTERVAL_MS, self._drain_cmd)
+        
+        # Decode all icons up front so set_icon is a cache lookup by first use
+        for icon_type in IconType:
+            self._request_icon_load(icon_type)
     
-    def _position_window(self) -> None:
-        """Position window in bottom-right corner of screen."""
-        self.window.update_idletasks()
-        screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
+    def _query_screen_size(self) -> tuple[int, int]:
+        """Query current screen dimensions from the window system.
         
+        Screen metrics do not depend on window realization, so no
+        update_idletasks() geometry pass is needed first.
+        """
+        return self.window.winfo_screenwidth(), self.window.winfo_screenheight()
+    
+    def _compute_geometry(self) -> str:
+        """Build the geometry string for the bottom-right corner of the cached screen."""
+        screen_width, screen_height = self._screen_size
         x = screen_width - self.size - self.margin
         y = screen_height - self.size - self.margin
+        return f'{self.size}x{self.size}+{x}+{y}'
+    
+    def _position_window(self) -> None:
+        """Position window in bottom-right corner of screen."""
+        self.window.geometry(self._geometry)
+    
+    def _set_pending(self, **changes: object) -> None:
+        """Record state changes to be applied together on the next drain tick.
         
-        self.window.geometry(f'{self.size}x{self.size}+{x}+{y}')
+        Safe to call from any thread; does not touch tkinter. Changes passed
+        in one call are recorded atomically, so they always land in the same frame.
+        
+        Args:
+            **changes: State keys ('visible', 'icon', 'border_color', 'pulsating',
+                'rotating') mapped to target values; only the last value per key is applied
+        """
+        with self._pending_lock:
+            self._pending_state.update(changes)
+    
+    def _drain(self) -> None:
+        """Run queued callables and apply pending state, then re-arm (called in main thread)."""
+        try:
+            while True:
+                try:
+                    command = self._cmd_q.get_nowait()
+                except queue.Empty:
+                    break
+                command()
+            if self._pending_state:
+                self._flush()
+        except Exception as e:
+            logger.error(f"Error applying UI update: {e}")
+        finally:
+            # Back off while hidden and idle; nothing on screen needs a fast reaction
+            if self._visible or self.pulsating or self.rotating:
+                delay = self.DRAIN_INTERVAL_MS
+            else:
+                delay = self.IDLE_DRAIN_INTERVAL_MS
+            self.window.tk.call('after', delay, self._drain_cmd)
+    
+    def _flush(self) -> None:
+        """Apply all pending state changes at once (called in main thread)."""
+        with self._pending_lock:
+            pending = self._pending_state
+            self._pending_state = {}
+        
+        if 'icon' in pending:
+            self._do_set_icon(pending['icon'])
+        if 'border_color' in pending:
+            self._do_set_border_color(pending['border_color'])
+        if 'pulsating' in pending and pending['pulsating'] != self.pulsating:
+            if pending['pulsating']:
+                self._do_start_pulsation()
+            else:
+                self._do_stop_pulsation()
+        if 'rotating' in pending and pending['rotating'] != self.rotating:
+            if pending['rotating']:
+                self._do_start_rotation()
+            else:
+                self._do_stop_rotation()
+        if 'visible' in pending:
+            if pending['visible']:
+                self._do_show()
+            else:
+                self._do_hide()
     
     def show(self) -> None:
         """Make window visible."""
-        # Schedule in tkinter's main thread
-        self.window.after(0, self._do_show)
+        self._set_pending(visible=True)
     
     def _do_show(self) -> None:
         """Actually show the window (called in main thread)."""
+        if self._visible:
+            return
+        self._visible = True
         self.window.deiconify()
         self.window.lift()
-        # Update position after showing (window needs to be visible to get correct screen dimensions)
+        # Re-query the screen (resolution may have changed while hidden) and
+        # re-apply the position (window managers may move withdrawn windows)
+        screen_size = self._query_screen_size()
+        if screen_size != self._screen_size:
+            self._screen_size = screen_size
+            self._geometry = self._compute_geometry()
         self._position_window()
         self.window.update_idletasks()
     
     def hide(self) -> None:
         """Make window invisible."""
-        # Schedule in tkinter's main thread
-        self.window.after(0, self._do_hide)
+        self._set_pending(visible=False)
+    
+    def hide_after(self, delay_ms: int) -> None:
+        """Hide the window after a delay (safe to call from any thread).
+        
+        Args:
+            delay_ms: Delay in milliseconds
+        """
+        self.call_later(delay_ms, self.hide)
+    
+    def call_later(self, delay_ms: int, callback: Callable[[], None]) -> None:
+        """Run callback in the main thread after a delay.
+        
+        Safe to call from any thread; the timer is armed by the main-thread drain.
+        
+        Args:
+            delay_ms: Delay in milliseconds
+            callback: Function to call
+        """
+        self._cmd_q.put(lambda: self.window.after(delay_ms, callback))
     
     def _do_hide(self) -> None:
         """Actually hide the window (called in main thread)."""
+        if not self._visible:
+            return
+        self._visible = False
         self.window.withdraw()
     
     def set_icon(self, icon_type: IconType) -> None:
@@ -144,166 +282,271 @@ class UIOverlay:
         Args:
             icon_type: Icon to display
         """
-        # Schedule in tkinter's main thread
-        self.window.after(0, lambda: self._do_set_icon(icon_type))
+        self._set_pending(icon=icon_type)
     
     def _do_set_icon(self, icon_type: IconType) -> None:
-        """Actually set the icon (called in main thread)."""
+        """Actually set the icon (called in main thread).
+        
+        Decoding and resizing run on the icon worker thread; only the
+        PhotoImage construction is posted back to the main thread.
+        """
+        # Re-entering the same state: the icon is already on the canvas
+        if icon_type is self.current_icon and self._installed_icon is icon_type:
+            return
+        
         self.current_icon = icon_type
         
-        # Load icon image
+        if (icon_type, self.size) in UIOverlay._icon_cache:
+            self._install_icon(icon_type)
+            return
+        
+        # Installed by the pending load once it completes
+        self._request_icon_load(icon_type)
+    
+    def _request_icon_load(self, icon_type: IconType) -> None:
+        """Queue an icon decode on the worker unless cached or already in flight."""
+        if (icon_type, self.size) in UIOverlay._icon_cache or icon_type in self._icon_loading:
+            return
+        self._icon_loading.add(icon_type)
+        future = self._icon_executor.submit(self._load_icon, icon_type)
+        future.add_done_callback(
+            lambda f: self._cmd_q.put(lambda: self._on_icon_loaded(icon_type, f))
+        )
+    
+    def _load_icon(self, icon_type: IconType) -> tuple[Image.Image, list[Image.Image]] | None:
+        """Decode, resize, and pre-rotate an icon (called in worker thread).
+        
+        Returns:
+            Tuple of (resized image, rotation frames), or None if the file is missing
+        """
         icon_path = icon_type.path
         if not icon_path.exists():
             logger.warning(f"Icon file not found: {icon_path}")
-            return
+            return None
         
+        # Resize to fit inside circle - use smaller size for better proportions
+        icon_size = int(self.size * 0.35)  # 35% of window size instead of 50%
+        # BILINEAR is indistinguishable from LANCZOS for small flat icons and much cheaper
         try:
-            image = Image.open(icon_path).convert("RGBA")
-            # Resize to fit inside circle - use smaller size for better proportions
-            icon_size = int(self.size * 0.35)  # 35% of window size instead of 50%
-            # Use LANCZOS for high-quality resampling (fallback to BICUBIC if not available)
-            try:
-                resample_method = Image.Resampling.LANCZOS
-            except AttributeError:
-                resample_method = Image.LANCZOS
-            image = image.resize((icon_size, icon_size), resample_method)
-            
-            # Store original image for rotation
-            self._original_image = image.copy()
-            
-            # Use ImageTk for reliable PhotoImage creation
-            self._photo_image = ImageTk.PhotoImage(image)
-            
-            # Remove old icon if exists
-            if self.icon_id:
-                self.canvas.delete(self.icon_id)
-            
-            # Create new icon in center
-            center = self.size // 2
-            self.icon_id = self.canvas.create_image(
-                center, center,
-                image=self._photo_image
-            )
+            resample_method = Image.Resampling.BILINEAR
+        except AttributeError:
+            resample_method = Image.BILINEAR
+        
+        with Image.open(icon_path) as source:
+            # Convert once, only when the asset is not already RGBA
+            image = source if source.mode == "RGBA" else source.convert("RGBA")
+            if image.size != (icon_size, icon_size):
+                # reducing_gap does a cheap integer downscale before the filter pass
+                # (the 512px assets are shrunk ~6x); unlike thumbnail() it still
+                # upscales the small error icon
+                image = image.resize((icon_size, icon_size), resample_method, reducing_gap=2.0)
+            elif image is source:
+                # Detach pixel data from the file before it is closed
+                image = source.copy()
+        
+        # Pre-rotate frames for the processing animation (frame i = i * ROTATION_STEP degrees).
+        # NEAREST is a single tap per pixel; at 10 degree steps the difference is not visible.
+        try:
+            rotate_method = Image.Resampling.NEAREST
+        except AttributeError:
+            rotate_method = Image.NEAREST
+        frames = [
+            image.rotate(-angle, resample=rotate_method, expand=False)
+            for angle in range(0, 360, self.ROTATION_STEP)
+        ]
+        return image, frames
+    
+    def _on_icon_loaded(self, icon_type: IconType, future) -> None:
+        """Build PhotoImages for a decoded icon and install it (called in main thread)."""
+        self._icon_loading.discard(icon_type)
+        try:
+            loaded = future.result()
+            if loaded is None:
+                return
+            UIOverlay._icon_cache[(icon_type, self.size)] = loaded
         except Exception as e:
-            logger.error(f"Error loading icon {icon_path}: {e}")
-            import traceback
+            logger.error(f"Error loading icon {icon_type.path}: {e}")
             traceback.print_exc()
+            return
+        
+        # Ignore stale loads if another icon was requested meanwhile
+        if self.current_icon is icon_type:
+            self._install_icon(icon_type)
+    
+    def _install_icon(self, icon_type: IconType) -> None:
+        """Display a decoded icon on the canvas (called in main thread)."""
+        image, frames = UIOverlay._icon_cache[(icon_type, self.size)]
+        photo = self._icon_photos.get(icon_type)
+        if photo is None:
+            # Use ImageTk for reliable PhotoImage creation; rotation frames stay
+            # PIL images and are pasted into one shared PhotoImage while rotating
+            photo = self._icon_photos[icon_type] = ImageTk.PhotoImage(image, master=self.window)
+        self._installed_icon = icon_type
+        self._original_image, self._photo_image, self._rotation_frames = image, photo, frames
+        self._rotation_photo_shown = False
+        self.canvas.itemconfig(self.icon_id, image=self._photo_image)
     
     def start_pulsation(self) -> None:
         """Begin pulsating border animation."""
-        # Schedule in tkinter's main thread
-        self.window.after(0, self._do_start_pulsation)
+        self._set_pending(pulsating=True)
     
     def _do_start_pulsation(self) -> None:
         """Actually start pulsation (called in main thread)."""
+        # New epoch invalidates any loop still chained from a previous start
+        self._pulse_epoch += 1
         self.pulsating = True
-        self._pulsate()
+        self._pulsate_start = time.monotonic()
+        self._pulsate_next = self._pulsate_start
+        self._pulsate(self._pulse_epoch)
     
     def stop_pulsation(self) -> None:
         """Stop pulsating border animation."""
-        # Schedule in tkinter's main thread
-        self.window.after(0, self._do_stop_pulsation)
+        self._set_pending(pulsating=False)
     
     def _do_stop_pulsation(self) -> None:
         """Actually stop pulsation (called in main thread)."""
         self.pulsating = False
+        self._pulse_epoch += 1
         if self._pulsation_job:
-            self.window.after_cancel(self._pulsation_job)
+            # Plain 'after cancel': after_cancel() would try to delete the registered command
+            self.window.tk.call('after', 'cancel', self._pulsation_job)
             self._pulsation_job = None
-        # Hide glow circle
-        self.canvas.itemconfig(self.glow_circle_id, state='hidden')
+        # Restore the resting border appearance (base color, default width)
+        self._apply_border(self._current_border_color, 6)
         # Reset pulsation time
-        if hasattr(self, '_pulsation_time'):
-            delattr(self, '_pulsation_time')
+        self._pulsation_time = 0.0
     
     def start_rotation(self) -> None:
         """Begin rotating icon animation (for processing state)."""
-        self.window.after(0, self._do_start_rotation)
+        self._set_pending(rotating=True)
     
     def _do_start_rotation(self) -> None:
         """Actually start rotation (called in main thread)."""
+        # New epoch invalidates any loop still chained from a previous start
+        self._rotation_epoch += 1
         self.rotating = True
         self._rotation_angle = 0
-        self._rotate()
+        self._rotation_next = time.monotonic()
+        self._rotate(self._rotation_epoch)
     
     def stop_rotation(self) -> None:
         """Stop rotating icon animation."""
-        self.window.after(0, self._do_stop_rotation)
+        self._set_pending(rotating=False)
     
     def _do_stop_rotation(self) -> None:
         """Actually stop rotation (called in main thread)."""
         self.rotating = False
+        self._rotation_epoch += 1
         if self._rotation_job:
-            self.window.after_cancel(self._rotation_job)
+            self.window.tk.call('after', 'cancel', self._rotation_job)
             self._rotation_job = None
         self._rotation_angle = 0
     
-    def _rotate(self) -> None:
-        """Rotation animation step."""
-        if not self.rotating or not self.icon_id:
+    def _rotate(self, epoch: int | str) -> None:
+        """Rotation animation step.
+        
+        Args:
+            epoch: Rotation epoch this loop was started in (a string when
+                invoked from Tcl); stale loops exit
+        """
+        if int(epoch) != self._rotation_epoch or not self.rotating:
             return
         
         # Rotate icon
-        self._rotation_angle = (self._rotation_angle + 10) % 360
+        self._rotation_angle = (self._rotation_angle + self.ROTATION_STEP) % 360
         
-        # Re-create icon with rotation
-        if self.current_icon and self._original_image:
+        # Swap in the pre-rotated frame (skipped while the icon is still loading)
+        if self._installed_icon is self.current_icon and self._rotation_frames:
             try:
-                # Rotate image
-                rotated = self._original_image.rotate(-self._rotation_angle, expand=False)
-                self._photo_image = ImageTk.PhotoImage(rotated)
-                if self.icon_id:
-                    self.canvas.itemconfig(self.icon_id, image=self._photo_image)
+                frame = self._rotation_frames[self._rotation_angle // self.ROTATION_STEP]
+                if self._rotation_photo is None:
+                    self._rotation_photo = ImageTk.PhotoImage(frame, master=self.window)
+                else:
+                    # Direct pixel copy into the existing Tk image; Tk redraws
+                    # every canvas item that displays it
+                    self._rotation_photo.paste(frame)
+                if not self._rotation_photo_shown:
+                    self.canvas.itemconfig(self.icon_id, image=self._rotation_photo)
+                    self._rotation_photo_shown = True
             except Exception as e:
                 logger.error(f"Error rotating icon: {e}")
         
-        # Schedule next rotation (30ms = ~33 FPS for smooth rotation)
-        self._rotation_job = self.window.after(30, self._rotate)
+        # Schedule next rotation on the ~33 FPS frame grid
+        self._rotation_next, delay = self._next_frame(self._rotation_next, self.ROTATION_INTERVAL)
+        self._rotation_job = self.window.tk.call('after', delay, self._rotate_cmd, epoch)
     
-    def _pulsate(self) -> None:
-        """Pulsation animation step with smooth color brightness pulsing."""
-        if not self.pulsating:
-            return
+    def _pulsate(self, epoch: int | str) -> None:
+        """Pulsation animation step driven by a smooth sine wave.
         
-        # Use sine wave for smooth pulsation
-        import math
-        if not hasattr(self, '_pulsation_time'):
-            self._pulsation_time = 0
+        Args:
+            epoch: Pulsation epoch this loop was started in (a string when
+                invoked from Tcl); stale loops exit
+        """
+        if int(epoch) != self._pulse_epoch or not self.pulsating:
+            return
         
-        # Increment time
-        self._pulsation_time += 0.12
+        now = time.monotonic()
+        interval = 1.0 / self.max_redraw_rate
         
-        # Calculate brightness using sine wave (0.5 to 1.0)
-        intensity = 0.5 + 0.5 * ((math.sin(self._pulsation_time) + 1) / 2)
-        
-        # Parse current color and apply brightness
-        color = self._current_border_color
-        if color.startswith('#') and len(color) == 7:
-            # Extract RGB components
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-            
-            # Apply intensity to main circle
-            pulse_r = int(r * intensity)
-            pulse_g = int(g * intensity)
-            pulse_b = int(b * intensity)
-            pulse_color = f'#{pulse_r:02x}{pulse_g:02x}{pulse_b:02x}'
+        # Drop the frame if the previous one was drawn less than an interval ago
+        # (e.g. idle callbacks bunched up while the main loop was busy)
+        if now - self._last_pulse_draw >= interval * 0.98:
+            self._last_pulse_draw = now
             
-            # Update main circle with pulsing color (fixed width)
-            self.canvas.itemconfig(self.circle_id, outline=pulse_color)
+            # Derive phase from elapsed wall time so load does not skew the wave
+            self._pulsation_time = (now - self._pulsate_start) * self.PULSE_SPEED
             
-            # Glow circle with brighter color (also fixed width)
-            glow_intensity = 0.7 + 0.3 * ((math.sin(self._pulsation_time) + 1) / 2)
-            glow_r = min(255, int(r * glow_intensity))
-            glow_g = min(255, int(g * glow_intensity))
-            glow_b = min(255, int(b * glow_intensity))
-            glow_color = f'#{glow_r:02x}{glow_g:02x}{glow_b:02x}'
+            # Normalized wave position (0.0 to 1.0)
+            wave = (math.sin(self._pulsation_time) + 1) / 2
+            self._draw_glow_frame(wave)
+        
+        # Schedule next pulsation on the frame grid; run it once Tk is idle so
+        # pending redraws are flushed before the next canvas update
+        self._pulsate_next, delay = self._next_frame(self._pulsate_next, interval)
+        self._pulsation_job = self.window.tk.call('after', delay, 'after', 'idle', self._pulse_cmd, epoch)
+    
+    @staticmethod
+    def _next_frame(deadline: float, interval: float) -> tuple[float, int]:
+        """Advance a frame deadline on a monotonic clock.
+        
+        Args:
+            deadline: Monotonic time the current frame was due
+            interval: Frame interval in seconds
             
-            self.canvas.itemconfig(self.glow_circle_id, state='normal', outline=glow_color, width=6)
+        Returns:
+            Tuple of (next deadline, delay in ms until it). Overdue frames are
+            dropped by resyncing to the current time instead of piling up.
+        """
+        now = time.monotonic()
+        deadline += interval
+        if deadline < now:
+            deadline = now + interval
+        return deadline, max(0, int((deadline - now) * 1000))
+    
+    def _draw_glow_frame(self, wave: float) -> None:
+        """Render one glow frame by recoloring the single border oval."""
+        # Calculate brightness using sine wave (0.5 to 1.0)
+        intensity = 0.5 + 0.5 * wave
         
-        # Schedule next pulsation (50ms = 20 FPS)
-        self._pulsation_job = self.window.after(50, self._pulsate)
+        # Apply brightness to the pre-parsed border color
+        rgb = self._border_rgb
+        if rgb is not None:
+            r, g, b = rgb
+            pulse_color = f'#{(int(r * intensity) << 16) | (int(g * intensity) << 8) | int(b * intensity):06x}'
+            # Update main circle with pulsing color (fixed width)
+            self._apply_border(pulse_color, self._last_main_width)
+    
+    def _apply_border(self, color: str, width: int) -> None:
+        """Apply border color and width, skipping the redraw when unchanged (called in main thread)."""
+        options = {}
+        if color != self._last_main_color:
+            options['outline'] = color
+        if width != self._last_main_width:
+            options['width'] = width
+        if options:
+            self.canvas.itemconfig(self.circle_id, **options)
+        self._last_main_color = color
+        self._last_main_width = width
     
     def show_error(self, message: str, duration: float = 2.5) -> None:
         """Display error briefly.
@@ -312,12 +555,12 @@ class UIOverlay:
             message: Error message to display
             duration: Display duration in seconds
         """
-        self.show()
-        self.set_icon(IconType.ERROR)
+        # Icon swap and show are recorded together so Tk renders a single frame
+        self._set_pending(icon=IconType.ERROR, visible=True)
         # TODO: Could add text display for message
         
         # Auto-dismiss after duration
-        self.window.after(int(duration * 1000), self.hide)
+        self.hide_after(int(duration * 1000))
     
     def set_border_color(self, color: str) -> None:
         """Set the border color.
@@ -325,11 +568,28 @@ class UIOverlay:
         Args:
             color: Color hex code (e.g., '#ff4444', '#4488ff')
         """
-        def _set_color():
-            self._current_border_color = color
-            self.canvas.itemconfig(self.circle_id, outline=color)
+        self._set_pending(border_color=color)
+    
+    def _do_set_border_color(self, color: str) -> None:
+        """Actually set the border color (called in main thread)."""
+        self._current_border_color = color
+        self._border_rgb = self._parse_color(color)
+        self._apply_border(color, self._last_main_width)
+    
+    @staticmethod
+    def _parse_color(color: str) -> tuple[int, int, int] | None:
+        """Parse a '#rrggbb' color into RGB components.
         
-        self.window.after(0, _set_color)
+        Returns:
+            Tuple of (r, g, b), or None if color is not in '#rrggbb' form
+        """
+        if not (color.startswith('#') and len(color) == 7):
+            return None
+        try:
+            value = int(color[1:], 16)
+        except ValueError:
+            return None
+        return (value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff
     
     def set_click_callback(self, callback: Callable[[], None]) -> None:
         """Set callback for click events.
@@ -1,21 +1,35 @@
 """Shared utilities, exceptions, and data models for Whisper Typer UI."""
 
+import functools
+import os
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
 from typing import Optional
 
-import numpy as np
 import sys
 
 
 # ============================================================================
 # Custom Exceptions (T005)
 # ============================================================================
+# Messages are formatted lazily in __str__, so exceptions that are caught and
+# inspected via their attributes never pay for string formatting.
 
-class MicrophoneError(Exception):
+class _BaseError(Exception):
+    """Base for application errors rendered from a class-level message template."""
+    
+    _TEMPLATE = ""
+    
+    def __str__(self) -> str:
+        return self._TEMPLATE.format(self=self)
+
+
+class MicrophoneError(_BaseError):
     """Microphone access or operation error."""
     
+    _TEMPLATE = "Microphone error [{self.error_code}]: device={self.device_name}"
+    
     def __init__(self, device_name: Optional[str], error_code: str):
         """
         Args:
@@ -24,12 +38,14 @@ class MicrophoneError(Exception):
         """
         self.device_name = device_name
         self.error_code = error_code
-        super().__init__(f"Microphone error [{error_code}]: device={device_name}")
+        super().__init__(device_name, error_code)
 
 
-class TranscriptionError(Exception):
+class TranscriptionError(_BaseError):
     """Transcription processing error."""
     
+    _TEMPLATE = "Transcription failed for {self.audio_length:.2f}s audio: {self.original_exception}"
+    
     def __init__(self, original_exception: Exception, audio_length: float):
         """
         Args:
@@ -38,12 +54,14 @@ class TranscriptionError(Exception):
         """
         self.original_exception = original_exception
         self.audio_length = audio_length
-        super().__init__(f"Transcription failed for {audio_length:.2f}s audio: {original_exception}")
+        super().__init__(original_exception, audio_length)
 
 
-class ConfigError(Exception):
+class ConfigError(_BaseError):
     """Configuration loading or validation error."""
     
+    _TEMPLATE = "Configuration error for '{self.config_key}': {self.message}"
+    
     def __init__(self, config_key: str, message: str = ""):
         """
         Args:
@@ -51,12 +69,15 @@ class ConfigError(Exception):
             message: Additional error details
         """
         self.config_key = config_key
-        super().__init__(f"Configuration error for '{config_key}': {message}")
+        self.message = message
+        super().__init__(config_key, message)
 
 
-class ModelLoadError(Exception):
+class ModelLoadError(_BaseError):
     """Model loading error for faster-whisper."""
     
+    _TEMPLATE = "Failed to load model '{self.model_size}' on {self.device}: {self.message}"
+    
     def __init__(self, model_size: str, device: str, message: str = ""):
         """
         Args:
@@ -66,14 +87,15 @@ class ModelLoadError(Exception):
         """
         self.model_size = model_size
         self.device = device
-        super().__init__(f"Failed to load model '{model_size}' on {device}: {message}")
+        self.message = message
+        super().__init__(model_size, device, message)
 
 
 # ============================================================================
 # Data Models and Enums (T007)
 # ============================================================================
 
-class SessionState(Enum):
+class SessionState(StrEnum):
     """Current state of a recording session."""
     IDLE = "idle"                    # No active session
     RECORDING = "recording"          # Microphone capturing audio
@@ -87,14 +109,21 @@ _DEFAULT_ASSET_DIR = Path(__file__).resolve().parent / "assets"
 _ALT_ASSET_DIR = Path(__file__).resolve().parent.parent / "assets"
 
 
-def _pyinstaller_asset_dir() -> Path:
+def _pyinstaller_asset_dir() -> Path | None:
     """Return the asset directory used by PyInstaller builds, if available."""
-    return Path(getattr(sys, "_MEIPASS", "")) / "assets"
+    meipass = getattr(sys, "_MEIPASS", None)
+    return Path(meipass) / "assets" if meipass else None
 
 
+@functools.lru_cache(maxsize=None)
 def resolve_asset_path(name: str) -> Path:
-    """Resolve an asset name to an on-disk path, supporting editable installs."""
+    """Resolve an asset name to an on-disk path, supporting editable installs.
+    
+    Results are cached; asset locations do not change during a session.
+    """
     for base in (_pyinstaller_asset_dir(), _DEFAULT_ASSET_DIR, _ALT_ASSET_DIR):
+        if base is None:
+            continue
         candidate = base / name
         if candidate.exists():
             return candidate
@@ -102,7 +131,7 @@ def resolve_asset_path(name: str) -> Path:
     return _DEFAULT_ASSET_DIR / name
 
 
-class IconType(Enum):
+class IconType(StrEnum):
     """UI overlay icon types."""
 
     MICROPHONE = "microphone.png"
@@ -112,10 +141,14 @@ class IconType(Enum):
     @property
     def path(self) -> Path:
         """Resolved filesystem path for the icon asset."""
-        return resolve_asset_path(self.value)
+        return _ICON_PATHS[self]
+
 
+# Resolved once at import so icon lookups on the UI path do no filesystem probes
+_ICON_PATHS: dict[IconType, Path] = {icon: resolve_asset_path(icon) for icon in IconType}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TranscriptionResult:
     """Output from faster-whisper transcription."""
     text: str                # Transcribed text (empty string if no speech detected)
@@ -131,16 +164,25 @@ class TranscriptionResult:
             raise ValueError(f"Processing time must be positive, got {self.processing_time}")
 
 
-@dataclass
-class ChunkTranscriptionResult:
-    """Result from transcribing a single audio chunk.
+# ============================================================================
+# Thread Placement
+# ============================================================================
+
+def pin_current_thread(cpus: set[int]) -> bool:
+    """Restrict the calling thread to the given CPUs where supported.
     
-    Attributes:
-        sequence: Sequential chunk number matching the input AudioChunk
-        text: Transcribed text content
-        error: Optional error message if transcription failed
+    On Linux sched_setaffinity(0, ...) applies to the calling thread only, and
+    threads it starts afterwards inherit the mask. Other platforms lack the
+    call, so this is a no-op there.
+    
+    Args:
+        cpus: CPU indices the thread may run on
+        
+    Returns:
+        True if the affinity was applied, False if unsupported or refused
     """
-    sequence: int
-    text: str
-    error: Optional[str] = None
-
+    try:
+        os.sched_setaffinity(0, cpus)
+    except (AttributeError, OSError):
+        return False
+    return True
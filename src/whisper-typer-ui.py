@@ -1,20 +1,25 @@
 #!/usr/bin/env python3
 """Whisper Typer UI - Cross-platform voice dictation application."""
 
+import functools
 import logging
+import os
+import queue
 import sys
 import threading
 import time
 from pathlib import Path
 
+import numpy as np
+
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import AppConfig, ConfigError
 from hotkey_manager import HotkeyManager
-from audio_recorder import AudioRecorder
+from audio_recorder import AudioChunk, AudioRecorder, Float32Pool
 from ui_overlay import UIOverlay, IconType
-from utils import SessionState, MicrophoneError, TranscriptionError, ModelLoadError
+from utils import SessionState, MicrophoneError, TranscriptionError, pin_current_thread
 from transcriber import Transcriber
 from text_inserter import TextInserter
 from streaming_session import StreamingSession
@@ -27,20 +32,44 @@ class WhisperTyperApp:
     """Main application controller."""
     
     def __init__(self):
-        """Initialize application."""
+        """Initialize application.
+        
+        Raises:
+            ConfigError: If the configuration is invalid
+            MicrophoneError: If no usable microphone is found
+            ValueError: If the hotkey cannot be registered
+        """
         logger.info("Initializing Whisper Typer UI...")
         
-        # Load configuration
+        # Load configuration (nothing to release yet if this fails)
+        self.config = AppConfig()
+        logger.info("Loaded configuration:")
+        logger.info(f"  - Config file: {self.config.config_path}")
+        logger.info(f"  - Language: {self.config.primary_language}")
+        logger.info(f"  - Hotkey: {self.config.hotkey_combo}")
+        logger.info(f"  - Model: {self.config.model_size} ({self.config.compute_type})")
+        
+        # The first CPU the process may use is kept for the chunk loop so
+        # inference threads can't delay its wakeups; the model and rounds get
+        # the rest. Honours taskset/cgroup masks; on fewer than 4 CPUs giving
+        # one up would cost inference too much, so nothing is pinned there.
         try:
-            self.config = AppConfig()
-            logger.info("Loaded configuration:")
-            logger.info(f"  - Config file: {self.config.config_path}")
-            logger.info(f"  - Language: {self.config.primary_language}")
-            logger.info(f"  - Hotkey: {self.config.hotkey_combo}")
-            logger.info(f"  - Model: {self.config.model_size} ({self.config.compute_type})")
-        except ConfigError as e:
-            logger.error(f"Configuration error: {e}")
-            sys.exit(1)
+            allowed = sorted(os.sched_getaffinity(0))
+        except AttributeError:
+            allowed = []
+        if len(allowed) >= 4:
+            self._loop_cpus: set[int] | None = {allowed[0]}
+            self._round_cpus: set[int] | None = set(allowed[1:])
+        else:
+            self._loop_cpus = self._round_cpus = None
+        
+        # The model loads in the background (started once the overlay exists,
+        # so a failure can be shown) and the hotkey is up immediately;
+        # recording may start before it is ready and the first transcription
+        # waits for it
+        self.transcriber: Transcriber | None = None
+        self._model_error: Exception | None = None
+        self._model_ready = threading.Event()
         
         # Initialize components
         self.session_state = SessionState.IDLE
@@ -49,34 +78,29 @@ class WhisperTyperApp:
         # Streaming session management
         self.streaming_session: StreamingSession | None = None
         self.is_processing = False  # Flag to prevent overlapping sessions
-        self._pending_insertions = 0  # Track pending text insertions
-        self._insertion_lock = threading.Lock()
+        self._stop_evt = threading.Event()  # Set to wake and end the chunk loop
+        # Text waiting to be inserted, typed in order by a single writer thread;
+        # Event items are flush markers set once everything before them is typed
+        self._insert_q: queue.SimpleQueue[str | threading.Event] = queue.SimpleQueue()
+        threading.Thread(target=self._insert_worker, daemon=True).start()
         
         # Initialize UI in main thread (tkinter requirement)
         self.ui = UIOverlay()
+        threading.Thread(target=self._load_model, daemon=True).start()
         
         # Initialize audio recorder
         try:
             self.recorder = AudioRecorder()
-            logger.info("Microphone initialized successfully")
-        except MicrophoneError as e:
-            logger.error(f"Microphone error: {e}")
-            sys.exit(1)
-        
-        # Initialize transcriber
-        try:
-            self.transcriber = Transcriber(
-                model_size=self.config.model_size,
-                device=self.config.device,
-                compute_type=self.config.compute_type,
-                language=self.config.primary_language,
-                beam_size=self.config.beam_size,
-                vad_filter=self.config.vad_filter,
-                cpu_workers=self.config.cpu_workers,
+            # Chunk buffers are recycled once their round has consumed them;
+            # one second of headroom absorbs extraction jitter
+            self.audio_pool = Float32Pool(
+                self.recorder.sample_rate * (self.config.chunk_duration + 1)
             )
-        except ModelLoadError as e:
-            logger.error(f"Model loading error: {e}")
-            sys.exit(1)
+            self.recorder.pool = self.audio_pool
+            logger.info("Microphone initialized successfully")
+        except MicrophoneError:
+            self.close()
+            raise
         
         # Initialize text inserter
         self.text_inserter = TextInserter()
@@ -86,9 +110,9 @@ class WhisperTyperApp:
             self.hotkey_mgr = HotkeyManager(self.config.hotkey_combo)
             self.hotkey_mgr.register(self.on_hotkey_press)
             logger.info(f"Hotkey registered: {self.config.hotkey_combo}")
-        except ValueError as e:
-            logger.error(f"Hotkey registration error: {e}")
-            sys.exit(1)
+        except ValueError:
+            self.close()
+            raise
         
         # Set click callback for UI
         self.ui.set_click_callback(self.on_ui_click)
@@ -96,6 +120,59 @@ class WhisperTyperApp:
         logger.info("Application ready!")
         logger.info(f"Press {self.config.hotkey_combo} to start recording")
     
+    def close(self) -> None:
+        """Release OS resources held by initialized components.
+        
+        Safe to call on a partially initialized app.
+        """
+        if hasattr(self, "hotkey_mgr"):
+            self.hotkey_mgr.stop()
+        if hasattr(self, "recorder"):
+            self.recorder.close()
+        if hasattr(self, "ui"):
+            self.ui.window.destroy()
+    
+    def _load_model(self) -> None:
+        """Load the Whisper model (runs in a background thread)."""
+        # CTranslate2 starts its inference threads while the model is built,
+        # and they inherit this thread's CPU mask
+        if self._round_cpus:
+            pin_current_thread(self._round_cpus)
+        try:
+            self.transcriber = Transcriber(
+                model_size=self.config.model_size,
+                device=self.config.device,
+                compute_type=self.config.compute_type,
+                language=self.config.primary_language,
+                beam_size=self.config.beam_size,
+                vad_filter=self.config.vad_filter,
+                cpu_workers=self.config.cpu_workers,
+                cpu_threads=min(len(self._round_cpus), 4) if self._round_cpus else 0,
+            )
+        except Exception as e:
+            logger.exception("Model loading error")
+            self._model_error = e
+            self.ui.show_error("Model failed to load", duration=5.0)
+        finally:
+            self._model_ready.set()
+    
+    def _get_transcriber(self) -> Transcriber:
+        """Return the transcriber, blocking until the model has loaded.
+        
+        Raises:
+            Exception: The error that made the model load fail (normally ModelLoadError)
+        """
+        if not self._model_ready.is_set():
+            logger.info("Waiting for model to finish loading...")
+            self._model_ready.wait()
+        if self._model_error is not None:
+            raise self._model_error
+        return self.transcriber
+    
+    def _transcribe_words(self, audio: np.ndarray, initial_prompt: str = "") -> list:
+        """Streaming transcription function that waits for the model on first use."""
+        return self._get_transcriber().transcribe_words(audio, initial_prompt)
+    
     def on_hotkey_press(self) -> None:
         """Handle hotkey press event."""
         if self.session_state == SessionState.IDLE and not self.is_processing:
@@ -115,17 +192,31 @@ class WhisperTyperApp:
             self.stop_streaming_recording()
     
     def start_streaming_recording(self) -> None:
-        """Start streaming recording session with parallel transcription."""
+        """Start streaming recording session with incremental transcription."""
+        if self._model_error is not None:
+            logger.error("Cannot record: model failed to load (%s)", self._model_error)
+            self.ui.show_error("Model failed to load", duration=2.5)
+            return
         try:
             logger.info("[STREAMING RECORDING STARTED]")
+            self._stop_evt.clear()
             self.session_state = SessionState.RECORDING
             self.is_processing = True
             
             # Initialize streaming session with thread-safe text insertion wrapper
             self.streaming_session = StreamingSession(
-                transcribe_fn=self.transcriber.transcribe_chunk,
+                transcribe_fn=self._transcribe_words,
                 insert_text_fn=self.insert_text_safe,  # Use thread-safe wrapper
-                on_error=self.on_streaming_error
+                on_error=self.on_streaming_error,
+                sample_rate=self.recorder.sample_rate,
+                # Leave room for several chunks so agreement can engage even
+                # with long chunk_duration settings
+                max_buffer_seconds=max(StreamingSession.MAX_BUFFER_SECONDS,
+                                       3 * self.config.chunk_duration),
+                worker_initializer=(
+                    functools.partial(pin_current_thread, self._round_cpus)
+                    if self._round_cpus else None
+                )
             )
             
             # Start audio recording
@@ -156,57 +247,86 @@ class WhisperTyperApp:
     def chunk_extraction_loop(self) -> None:
         """Continuously extract and submit chunks during recording."""
         try:
-            while self.session_state == SessionState.RECORDING:
-                # Wait for chunk duration
-                time.sleep(self.config.chunk_duration)
-                
-                # Check if still recording
-                if self.session_state != SessionState.RECORDING:
-                    break
+            if self._loop_cpus:
+                pin_current_thread(self._loop_cpus)
+            
+            # Deadlines advance on a fixed grid so extraction cost doesn't
+            # accumulate as drift; a stop wakes the wait immediately
+            chunk_duration = self.config.chunk_duration
+            next_deadline = time.monotonic() + chunk_duration
+            while not self._stop_evt.wait(max(0.0, next_deadline - time.monotonic())):
+                next_deadline += chunk_duration
                 
                 # Extract chunk from recorder
                 chunk = self.recorder.extract_chunk()
                 
-                logger.info(f"[CHUNK {chunk.sequence}] Extracted {len(chunk.data) / self.recorder.sample_rate:.2f}s audio, submitting for transcription")
+                # Silent chunks would only cost a full Whisper pass and
+                # invite hallucinated phrases ("Thank you."), unless words are
+                # still awaiting agreement: the round after a pause is what
+                # confirms the end of the utterance
+                rms = float(np.sqrt(np.mean(np.square(chunk.data)))) if len(chunk.data) else 0.0
+                silent = len(chunk.data) == 0 or rms < self.config.vad_rms_threshold
+                if silent and not (self.streaming_session and self.streaming_session.has_pending_words):
+                    logger.info("[CHUNK %d] Silence (RMS %.4f), skipped", chunk.sequence, rms)
+                    self.audio_pool.put(chunk.data)
+                    continue
+                
+                logger.info("[CHUNK %d] Extracted %.2fs audio, submitting for transcription",
+                            chunk.sequence, len(chunk.data) / self.recorder.sample_rate)
                 
                 # Submit to streaming session
                 if self.streaming_session:
-                    self.streaming_session.submit_chunk(chunk)
+                    future = self.streaming_session.submit_chunk(chunk)
+                    if future is not None:
+                        # The round copies chunk data into its buffer, so the
+                        # pooled array is free once the round is done
+                        future.add_done_callback(
+                            lambda _, data=chunk.data: self.audio_pool.put(data)
+                        )
                     
         except Exception as e:
-            logger.error(f"Error in chunk extraction loop: {e}")
+            logger.error("Error in chunk extraction loop: %s", e)
             self.on_streaming_error(e)
     
     def insert_text_safe(self, text: str) -> None:
         """Thread-safe wrapper for text insertion.
         
-        Schedules text insertion in main thread via tkinter.
-        This is required because text_inserter uses clipboard/keyboard
-        which may not be thread-safe when called from worker threads.
+        Queues text for the single insertion thread, so clipboard/keyboard
+        access is never concurrent and text keeps its order without blocking
+        the tkinter main loop. Text queued while an insertion is typing is
+        inserted in a single call.
         
         Args:
             text: Text to insert
         """
-        # Increment pending insertions counter
-        with self._insertion_lock:
-            self._pending_insertions += 1
-        
-        # Schedule insertion in main thread
-        def do_insert():
+        self._insert_q.put(text)
+    
+    def _insert_worker(self) -> None:
+        """Type queued text in order (runs in a dedicated daemon thread)."""
+        while True:
+            items = [self._insert_q.get()]
+            while True:
+                try:
+                    items.append(self._insert_q.get_nowait())
+                except queue.Empty:
+                    break
             try:
-                self.text_inserter.type_text(text)
+                text = "".join(item for item in items if isinstance(item, str))
+                if text:
+                    self.text_inserter.type_text(text)
+            except Exception as e:
+                logger.error("Text insertion error: %s", e)
             finally:
-                # Decrement counter when done
-                with self._insertion_lock:
-                    self._pending_insertions -= 1
-        
-        self.ui.window.after(0, do_insert)
+                for item in items:
+                    if isinstance(item, threading.Event):
+                        item.set()
     
     def stop_streaming_recording(self) -> None:
         """Stop streaming recording and finalize transcription."""
         logger.info("[STREAMING RECORDING STOPPED]")
         
-        # Change state immediately to stop chunk extraction loop
+        # Wake and stop the chunk extraction loop before changing state
+        self._stop_evt.set()
         self.session_state = SessionState.TRANSCRIBING
         
         # Extract final chunk BEFORE stopping the stream
@@ -224,53 +344,45 @@ class WhisperTyperApp:
         
         logger.info(f"[FINAL CHUNK {final_chunk.sequence}] Extracted {len(final_chunk.data) / self.recorder.sample_rate:.2f}s audio")
         
-        # Submit final chunk if it has audio
-        if self.streaming_session and len(final_chunk.data) > 0:
-            self.streaming_session.submit_chunk(final_chunk)
-        
-        # Finalize in background thread
+        # Transcribe the final chunk and finalize in background thread
         finalize_thread = threading.Thread(
             target=self.finalize_streaming_session,
+            args=(final_chunk,),
             daemon=True
         )
         finalize_thread.start()
     
-    def finalize_streaming_session(self) -> None:
-        """Wait for all chunks to complete and insert remaining text."""
+    def finalize_streaming_session(self, final_chunk: AudioChunk) -> None:
+        """Transcribe the final chunk, wait for all rounds and insert remaining text.
+        
+        Args:
+            final_chunk: Audio recorded since the last extracted chunk
+        """
         try:
             logger.info("[FINALIZING STREAMING SESSION]")
             
             if self.streaming_session:
-                # This blocks until all chunks complete
-                self.streaming_session.finalize_and_insert()
+                # This blocks until all rounds complete
+                self.streaming_session.append_and_finalize(final_chunk)
                 self.streaming_session = None
+            self.audio_pool.put(final_chunk.data)
             
             # Wait for all pending text insertions to complete
             logger.info("[FINALIZE] Waiting for pending text insertions...")
-            max_wait = 50  # Wait up to 5 seconds (50 * 100ms)
-            wait_count = 0
-            while wait_count < max_wait:
-                with self._insertion_lock:
-                    if self._pending_insertions == 0:
-                        break
-                    pending = self._pending_insertions
-                logger.info(f"[FINALIZE] {pending} insertions pending, waiting...")
-                time.sleep(0.1)
-                wait_count += 1
-            
-            with self._insertion_lock:
-                if self._pending_insertions > 0:
-                    logger.warning(f"[FINALIZE] WARNING: {self._pending_insertions} insertions still pending after timeout")
-                else:
-                    logger.info("[FINALIZE] All text insertions completed")
+            flushed = threading.Event()
+            self._insert_q.put(flushed)
+            if flushed.wait(timeout=5.0):  # Wait up to 5 seconds
+                logger.info("[FINALIZE] All text insertions completed")
+            else:
+                logger.warning("[FINALIZE] WARNING: text insertions still pending after timeout")
             
             logger.info("[STREAMING SESSION COMPLETED]")
             
             # Schedule UI hide after short delay
-            self.ui.window.after(300, self.ui.hide)
+            self.ui.hide_after(300)
             
         except Exception as e:
-            logger.error(f"Error finalizing streaming session: {e}")
+            logger.error("Error finalizing streaming session: %s", e)
             self.ui.show_error("Finalization failed", duration=2.5)
         finally:
             # Stop rotation
@@ -292,6 +404,7 @@ class WhisperTyperApp:
         self.ui.show_error("Transcription failed", duration=2.5)
         
         # Clean up session
+        self._stop_evt.set()
         self.streaming_session = None
         self.session_state = SessionState.ERROR
         self.is_processing = False
@@ -301,7 +414,7 @@ class WhisperTyperApp:
             self.session_state = SessionState.IDLE
             logger.info("Ready for next recording")
         
-        self.ui.window.after(2500, reset_to_idle)
+        self.ui.call_later(2500, reset_to_idle)
     
     def start_recording(self) -> None:
         """Start recording session."""
@@ -359,15 +472,12 @@ class WhisperTyperApp:
             # Transcribe audio
             logger.info("[TRANSCRIPTION STARTED]")
             
-            # Force UI update before starting heavy computation
-            self.ui.window.update_idletasks()
-            
-            result = self.transcriber.transcribe(self.audio_buffer)
+            # No direct Tk calls here: this is a worker thread and tkinter is
+            # not thread-safe. UI changes go through the overlay's thread-safe
+            # methods, which its main-thread drain applies.
+            result = self._get_transcriber().transcribe(self.audio_buffer)
             logger.info("[TRANSCRIPTION COMPLETED]")
             
-            # Force UI update after transcription
-            self.ui.window.update_idletasks()
-            
             # Clean up audio buffer immediately (FR-026, FR-027)
             self.audio_buffer = None
             
@@ -383,7 +493,7 @@ class WhisperTyperApp:
                 self.session_state = SessionState.COMPLETED
                 
                 # Schedule UI hide after short delay
-                self.ui.window.after(300, self.ui.hide)
+                self.ui.hide_after(300)
             else:
                 logger.info("Empty transcription - no text to insert")
                 self.session_state = SessionState.COMPLETED
@@ -425,7 +535,12 @@ class WhisperTyperApp:
 
 def main():
     """Application entry point."""
-    app = WhisperTyperApp()
+    try:
+        app = WhisperTyperApp()
+    except (ConfigError, MicrophoneError, ValueError):
+        # Components were already released by the constructor
+        logger.exception("Failed to initialize Whisper Typer UI")
+        sys.exit(1)
     app.run()
 
 